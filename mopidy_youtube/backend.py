@@ -1,5 +1,6 @@
 import json
 import os
+from concurrent.futures.thread import ThreadPoolExecutor
 from http.cookiejar import DefaultCookiePolicy, MozillaCookieJar
 from http.cookies import SimpleCookie
 
@@ -10,13 +11,13 @@ from mopidy.core import CoreListener
 from mopidy.models import Image, Ref, SearchResult, Track, model_json_decoder
 
 from mopidy_youtube import Extension, logger, youtube
-from mopidy_youtube.apis import youtube_japi
 from mopidy_youtube.converters import convert_playlist_to_album, convert_video_to_track
 from mopidy_youtube.data import (
     extract_channel_id,
     extract_playlist_id,
     extract_preload_tracks,
     extract_video_id,
+    uri_video_prefixes,
 )
 from mopidy_youtube.youtube import Video
 
@@ -53,11 +54,18 @@ class YouTubeCoreListener(pykka.ThreadingActor, CoreListener):
         video_ids = [
             extract_video_id(track.uri)
             for track in tracks
-            if track.uri.startswith("youtube:video:")
-            or track.uri.startswith("yt:video:")
+            if track.uri.startswith(uri_video_prefixes)
         ]
+        # the same video can be queued more than once; resolve it only once
+        video_ids = list(dict.fromkeys(video_id for video_id in video_ids if video_id))
+        if not video_ids:
+            return
+
+        # audio_url is resolved (youtube_dl) in the calling thread, so fetch
+        # them in parallel rather than one video after another
         videos = [youtube.Video.get(video_id) for video_id in video_ids]
-        [video.audio_url for video in videos]
+        with ThreadPoolExecutor(max_workers=min(16, len(videos))) as executor:
+            executor.map(lambda video: video.audio_url, videos)
 
 
 class YouTubeBackend(pykka.ThreadingActor, backend.Backend):
@@ -124,6 +132,8 @@ class YouTubeBackend(pykka.ThreadingActor, backend.Backend):
                 logger.info("YouTube API key verified")
 
         if youtube.api_enabled is False:
+            from mopidy_youtube.apis import youtube_japi
+
             logger.info("using jAPI")
             youtube.Entry.api = youtube_japi.jAPI(proxy, headers)
 
@@ -137,18 +147,15 @@ class YouTubeBackend(pykka.ThreadingActor, backend.Backend):
                     policy=DefaultCookiePolicy(allowed_domains="youtube.com"),
                 )
                 cj.load()
-                cookie_parts = []
-                for cookie in cj:
-                    cookie_parts.append(
-                        "%s=%s"
-                        % (
-                            cookie.name,
-                            SimpleCookie()
-                            .value_encode(cookie.value)[1]
-                            .replace('"', ""),
-                        )
+                encoder = SimpleCookie()
+                cookie_parts = [
+                    "%s=%s"
+                    % (
+                        cookie.name,
+                        encoder.value_encode(cookie.value)[1].replace('"', ""),
                     )
-
+                    for cookie in cj
+                ]
                 youtube.musicapi_cookie = "; ".join(cookie_parts)
             if youtube.musicapi_cookie:
                 headers.update({"Cookie": youtube.musicapi_cookie})
@@ -178,52 +185,62 @@ class YouTubeLibraryProvider(backend.LibraryProvider):
     cache_max_len = 4000
     cache_ttl = 21600
 
-    youtube_library_cache = TTLCache(maxsize=cache_max_len, ttl=cache_ttl)
+    # separate caches per kind of uri, so the few, expensive artist / channel
+    # listings are not evicted by the many playlist listings
+    browse_artists_cache = TTLCache(maxsize=cache_max_len, ttl=cache_ttl)
+    browse_channel_cache = TTLCache(maxsize=cache_max_len, ttl=cache_ttl)
+    browse_playlist_cache = TTLCache(maxsize=cache_max_len, ttl=cache_ttl)
+
+    root_directory_refs = (
+        Ref.directory(uri="youtube:channel:root", name="My Youtube playlists"),
+        Ref.directory(uri="youtube:channel:artists", name="My Youtube artists"),
+    )
 
-    @cached(cache=youtube_library_cache)
     def browse(self, uri):
         if uri == "youtube:browse":
-            return [
-                Ref.directory(uri="youtube:channel:root", name="My Youtube playlists"),
-                Ref.directory(uri="youtube:channel:artists", name="My Youtube artists"),
-            ]
+            return list(self.root_directory_refs)
         if uri == "youtube:channel:artists":
-            artistrefs = set()
-            pl = []
-            playlists = [
-                self.lookup(f"yt:playlist:{playlist.id}")
-                for playlist in youtube.Channel.playlists("root")
-            ]
-            for playlist in playlists:
-                for track in playlist:
-                    [
-                        artistrefs.add(Ref.artist(uri=artist.uri, name=artist.name))
-                        for artist in track.artists
-                        if artist.uri
-                    ]
-
-            artistrefs_list = list(artistrefs)
-            artistrefs_list.sort(key=lambda x: x.name.lower())
-            return artistrefs_list
+            return self.browse_artists()
         if extract_playlist_id(uri):
-            trackrefs = []
-            tracks = self.lookup(uri)
-            for track in tracks:
-                trackrefs.append(Ref.track(uri=track.uri, name=track.name))
-            return trackrefs
+            return self.browse_playlist(uri)
         elif extract_channel_id(uri):
-            logger.debug(f"browse channel / library {uri}")
-            playlistrefs = []
-            albums = []
-            playlists = youtube.Channel.playlists(extract_channel_id(uri))
-            if playlists:
-                for pl in playlists:
-                    pl.videos
-                    albums.append(convert_playlist_to_album(pl))
-                for album in albums:
-                    playlistrefs.append(Ref.playlist(uri=album.uri, name=album.name))
-            playlistrefs.sort(key=lambda x: x.name.lower())
-            return playlistrefs
+            return self.browse_channel(uri)
+
+    @cached(cache=browse_artists_cache)
+    def browse_artists(self):
+        channel_playlists = youtube.Channel.playlists("root") or []
+        for playlist in channel_playlists:
+            playlist.videos  # start loading all playlists before looking them up
+        playlists = [
+            self.lookup(f"yt:playlist:{playlist.id}") for playlist in channel_playlists
+        ]
+        artistrefs = {
+            Ref.artist(uri=artist.uri, name=artist.name)
+            for playlist in playlists
+            for track in playlist
+            for artist in track.artists
+            if artist.uri
+        }
+        return sorted(artistrefs, key=lambda x: x.name.casefold())
+
+    @cached(cache=browse_playlist_cache)
+    def browse_playlist(self, uri):
+        return [Ref.track(uri=track.uri, name=track.name) for track in self.lookup(uri)]
+
+    @cached(cache=browse_channel_cache)
+    def browse_channel(self, uri):
+        logger.debug(f"browse channel / library {uri}")
+        albums = []
+        playlists = youtube.Channel.playlists(extract_channel_id(uri))
+        if playlists:
+            for pl in playlists:
+                pl.videos  # start loading
+                albums.append(convert_playlist_to_album(pl))
+        playlistrefs = [
+            Ref.playlist(uri=album.uri, name=album.name) for album in albums
+        ]
+        playlistrefs.sort(key=lambda x: x.name.casefold())
+        return playlistrefs
 
     """
     Called when browsing or searching the library. To avoid horrible browsing
@@ -268,20 +285,23 @@ class YouTubeLibraryProvider(backend.LibraryProvider):
             logger.error('backend search error "%s"', e)
             return None
 
+        videos = []
+        playlists = []
+        for entry in entries:
+            if entry.is_video:
+                videos.append(entry)
+            else:
+                playlists.append(entry)
+
         # load playlist info (to get video_count) of all playlists together
-        playlists = [entry for entry in entries if not entry.is_video]
         youtube.Playlist.load_info(playlists)
 
         # load video info (to get length) of all videos together
-        youtube.Video.load_info([entry for entry in entries if entry.is_video])
+        youtube.Video.load_info(videos)
 
         albums = []
         artists = []
-        tracks = []
-
-        for entry in entries:
-            if entry.is_video:
-                tracks.append(convert_video_to_track(entry))
+        tracks = [convert_video_to_track(video) for video in videos]
 
         # load video info and playlist videos in the background. they should be
         # ready by the time the user adds search results to the playing queue
@@ -295,33 +315,47 @@ class YouTubeLibraryProvider(backend.LibraryProvider):
 
         return search_result
 
+    # tracks read from the file cache; the json files do not change once
+    # written, so there is no need to parse them again on every lookup
+    track_file_cache = TTLCache(maxsize=cache_max_len, ttl=cache_ttl)
+
+    @cached(cache=track_file_cache)
+    def read_cached_track(self, video_id: str) -> Track:
+        with open(
+            os.path.join(youtube.cache_location, f"{video_id}.json"), "r"
+        ) as infile:
+            return json.load(infile, object_hook=model_json_decoder)
+
     def lookup_video_track(self, video_id: str) -> Track:
         if youtube.cache_location:
-            if f"{video_id}.json" in os.listdir(youtube.cache_location):
-                with open(
-                    os.path.join(youtube.cache_location, f"{video_id}.json"), "r"
-                ) as infile:
-                    track = json.load(infile, object_hook=model_json_decoder)
-                return track
+            if youtube.is_cached(f"{video_id}.json"):
+                return self.read_cached_track(video_id)
 
         video = youtube.Video.get(video_id)
+        # goes through Video.queue_info, so an uncached video waits an extra
+        # info_queue_delay (20ms) here for other requests to share the call
         video.title.get()
         return convert_video_to_track(video)
 
     def lookup_playlist_tracks(self, playlist_id: str):
         playlist = youtube.Playlist.get(playlist_id)
-        if not playlist.videos.get():
+        videos = playlist.videos.get()
+        if not videos:
             return None
 
+        # Playlist.videos has already started loading info for all of its
+        # videos, so this is normally a no-op; it only covers videos whose
+        # info futures were dropped
+        youtube.Video.queue_info(videos)
+
         # ignore videos for which no info was found (removed, etc)
-        videos = [
-            video for video in playlist.videos.get() if video.length.get() is not None
-        ]
+        videos = [video for video in videos if video.length.get() is not None]
 
+        album_name = playlist.title.get()
         tracks = [
             convert_video_to_track(
                 video,
-                album_name=playlist.title.get(),
+                album_name=album_name,
                 album_id=playlist_id,
             )
             for video in videos
@@ -334,9 +368,12 @@ class YouTubeLibraryProvider(backend.LibraryProvider):
         if not channel_playlists:
             return None
 
+        # start loading all playlists before waiting for any of them
+        playlist_videos = [playlist.videos for playlist in channel_playlists]
+
         videos = []
-        for playlist in channel_playlists:
-            videos.extend(playlist.videos.get())
+        for future in playlist_videos:
+            videos.extend(future.get() or [])
 
         tracks = [convert_video_to_track(video) for video in videos]
 
@@ -365,6 +402,9 @@ class YouTubeLibraryProvider(backend.LibraryProvider):
 
         preload = extract_preload_tracks(uri)
         if preload:
+            # preload data is already complete, so setting it is cheap in-memory
+            # work; no API calls are made here
+            minimum_fields = ["title", "length", "channel"]
             for track in preload["preloadTracks"]:
                 # need to be more careful here: preload data is ytmusic; some information
                 # might not be compatible with other backends. see, for example
@@ -372,7 +412,6 @@ class YouTubeLibraryProvider(backend.LibraryProvider):
                 # taken from the album column in the [ytm] page you wanted to link to,
                 # has no equivalent URL on YouTube
                 video = Video.get(track["id"]["videoId"])
-                minimum_fields = ["title", "length", "channel"]
                 item, extended_fields = video.extend_fields(track, minimum_fields)
                 video._set_api_data(extended_fields, item)
             uri = preload["videoUri"]
@@ -405,18 +444,19 @@ class YouTubeLibraryProvider(backend.LibraryProvider):
         video_ids = [extract_video_id(uri) for uri in uris]
 
         if youtube.cache_location and self.backend.config.get("http").get("enabled"):
-            for uri in uris:
-                video_id = extract_video_id(uri)
+            cached_ids = []
+            for uri, video_id in zip(uris, video_ids):
                 if video_id:
-                    if f"{video_id}.webp" in os.listdir(youtube.cache_location):
+                    if youtube.is_cached(f"{video_id}.webp"):
                         images.update({uri: [Image(uri=f"/youtube/{video_id}.webp")]})
-                    elif f"{video_id}.jpg" in os.listdir(youtube.cache_location):
+                        cached_ids.append(video_id)
+                    elif youtube.is_cached(f"{video_id}.jpg"):
                         images.update({uri: [Image(uri=f"/youtube/{video_id}.jpg")]})
+                        cached_ids.append(video_id)
 
-            logger.debug(
-                f"using cached images: {[extract_video_id(uri) for uri in images]}"
-            )
+            logger.debug(f"using cached images: {cached_ids}")
 
+        # video thumbnails are constant urls, no request is made for them
         images.update(
             {
                 uri: youtube.Video.get(video_id).thumbnails.get()
@@ -427,18 +467,21 @@ class YouTubeLibraryProvider(backend.LibraryProvider):
         )
 
         playlist_ids = [extract_playlist_id(uri) for uri in uris]
-        images.update(
-            {
-                uri: youtube.Playlist.get(playlist_id).thumbnails.get()
-                for uri, playlist_id in zip(uris, playlist_ids)
-                if playlist_id
-            }
-        )
+        playlists = [
+            (uri, youtube.Playlist.get(playlist_id))
+            for uri, playlist_id in zip(uris, playlist_ids)
+            if playlist_id
+        ]
+        # load thumbnails of all playlists with one (batched) api call, rather
+        # than one call per playlist
+        youtube.Playlist.load_info([playlist for _, playlist in playlists])
+        images.update({uri: playlist.thumbnails.get() for uri, playlist in playlists})
         return images
 
 
 class YouTubePlaybackProvider(backend.PlaybackProvider):
-    def should_download(self, uri):
+    @staticmethod
+    def should_download(uri):
         return True
 
     def translate_uri(self, uri):
@@ -455,6 +498,8 @@ class YouTubePlaybackProvider(backend.PlaybackProvider):
         # if not video_id:
         #     return None
 
+        # no need for a separate url cache here: Video.get keeps the Video for
+        # 6h and audio_url memoizes its future, so replaying a track is cheap
         try:
             return youtube.Video.get(video_id).audio_url.get()
         except Exception as e:
@@ -6,16 +6,16 @@ from requests.packages.urllib3.util.retry import Retry
 from requests.packages.urllib3.util.timeout import Timeout
 
 
-# is this necessary or worthwhile?  Are there any bad
-# consequences that arise if timeout isn't set like this?
+# requests has no default timeout, so a stalled connection would block the
+# calling thread (and any thread pool waiting on it) forever. Session.get/post
+# end up in HTTPAdapter.send, which is where the default has to be applied.
 class MyHTTPAdapter(HTTPAdapter):
-    def get(self, *args, **kwargs):
-        kwargs["timeout"] = (6.05, 27)
-        return super(MyHTTPAdapter, self).get(*args, **kwargs)
+    timeout = (6.05, 27)
 
-    def post(self, *args, **kwargs):
-        kwargs["timeout"] = (6.05, 27)
-        return super(MyHTTPAdapter, self).post(*args, **kwargs)
+    def send(self, request, timeout=None, **kwargs):
+        if timeout is None:
+            timeout = self.timeout
+        return super(MyHTTPAdapter, self).send(request, timeout=timeout, **kwargs)
 
     def init_poolmanager(self, *args, **kwargs):
         kwargs["timeout"] = Timeout(connect=6.05, read=27)
@@ -1,9 +1,11 @@
 import json
 import re
+from functools import lru_cache
 from urllib.parse import parse_qs, urlparse
 
 from mopidy_youtube.apis.ytm_item_to_video import ytm_item_to_video
 
+uri_video_prefixes = ("youtube:video:", "yt:video:")
 uri_video_regex = re.compile("^(?:youtube|yt):video:(?P<videoid>.{11})$")
 uri_playlist_regex = re.compile("^(?:youtube|yt):playlist:(?P<playlistid>.+)$")
 uri_channel_regex = re.compile("^(?:youtube|yt):channel:(?P<channelid>.+)$")
@@ -33,6 +35,7 @@ def format_channel_uri(id) -> str:
     return f"youtube:channel:{id}"
 
 
+@lru_cache(maxsize=8192)
 def extract_video_id(uri) -> str:
     if uri is None:
         return ""
@@ -57,6 +60,7 @@ def extract_video_id(uri) -> str:
     return ""
 
 
+@lru_cache(maxsize=8192)
 def extract_playlist_id(uri) -> str:
     if "youtube.com" in uri:
         url = urlparse(uri.replace("yt:", "").replace("youtube:", ""))
@@ -71,6 +75,7 @@ def extract_playlist_id(uri) -> str:
     return ""
 
 
+@lru_cache(maxsize=8192)
 def extract_channel_id(uri) -> str:
     for regex in (uri_channel_regex, old_uri_channel_regex):
         match = regex.match(uri)
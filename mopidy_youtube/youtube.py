@@ -2,6 +2,8 @@ import importlib
 import json
 import os
 import shutil
+import threading
+import time
 from concurrent.futures.thread import ThreadPoolExecutor
 
 import pykka
@@ -20,6 +22,44 @@ musicapi_cookiefile = None
 youtube_dl = None
 youtube_dl_package = "youtube_dl"
 
+_cache_index = set()
+_cache_index_mtime = None
+_cache_index_error_logged = False
+
+# directory mtimes come from a coarse clock (up to 2s on FAT), so a file
+# created in the same tick as a scan would not change the mtime we compare
+# against; an index scanned that close to the last change is rescanned
+_cache_index_racy_ns = 2_000_000_000
+
+
+def is_cached(filename):
+    """
+    Returns True if filename exists in cache_location. The directory is only
+    read again when its modification time has changed, so repeated checks
+    cost a single stat instead of a full listdir. Files written by this
+    module are added to the index directly; the rescan picks up the rest
+    (eg audio files written by youtube_dl).
+    """
+
+    global _cache_index, _cache_index_mtime, _cache_index_error_logged
+    if not cache_location:
+        return False
+    try:
+        mtime = os.stat(cache_location).st_mtime_ns
+        if mtime != _cache_index_mtime:
+            with os.scandir(cache_location) as entries:
+                _cache_index = {entry.name for entry in entries}
+            if time.time_ns() - mtime < _cache_index_racy_ns:
+                _cache_index_mtime = None
+            else:
+                _cache_index_mtime = mtime
+    except OSError as e:
+        if not _cache_index_error_logged:
+            logger.error(f"cache index error {e}")
+            _cache_index_error_logged = True
+        return False
+    return filename in _cache_index
+
 
 def async_property(func):
     """
@@ -240,14 +280,66 @@ class Video(Entry):
 
     total_bytes = 0
 
+    info_fields = ["title", "length", "channel"]
+
+    # videos waiting to be loaded together by queue_info
+    info_queue = []
+    info_queue_delay = 0.02
+    info_queue_lock = threading.Lock()
+    info_queue_timer = None
+
     @classmethod
     def load_info(cls, listOfVideos):
         """
         loads title, length, channel of multiple videos using one API call for
         every 50 videos. API calls are split in separate threads.
         """
-        minimum_fields = ["title", "length", "channel"]
-        listOfVideos = cls._add_futures(listOfVideos, minimum_fields)
+        listOfVideos = cls._add_futures(listOfVideos, cls.info_fields)
+        cls._fetch_info(listOfVideos)
+
+    @classmethod
+    def queue_info(cls, listOfVideos):
+        """
+        like load_info, but videos are collected for up to info_queue_delay
+        seconds, so that videos requested one at a time, from different
+        threads, share API calls. Usually returns at once, leaving the fetch
+        to a timer thread; but once 50 videos are waiting, the calling thread
+        fetches the whole queue itself and blocks for that API call.
+
+        The price is that a lone video's info arrives info_queue_delay later
+        than with load_info, even when nothing else is requested meanwhile.
+        """
+        listOfVideos = cls._add_futures(listOfVideos, cls.info_fields)
+        if not listOfVideos:
+            return
+
+        with cls.info_queue_lock:
+            cls.info_queue.extend(listOfVideos)
+            flush_now = len(cls.info_queue) >= 50
+            if not flush_now and cls.info_queue_timer is None:
+                cls.info_queue_timer = threading.Timer(
+                    cls.info_queue_delay, cls._flush_info_queue
+                )
+                cls.info_queue_timer.daemon = True
+                cls.info_queue_timer.start()
+
+        if flush_now:
+            cls._flush_info_queue()
+
+    @classmethod
+    def _flush_info_queue(cls):
+        with cls.info_queue_lock:
+            queued = cls.info_queue[:]
+            del cls.info_queue[:]
+            if cls.info_queue_timer is not None:
+                cls.info_queue_timer.cancel()
+                cls.info_queue_timer = None
+        if queued:
+            cls._fetch_info(queued)
+
+    @classmethod
+    def _fetch_info(cls, listOfVideos):
+        minimum_fields = cls.info_fields
 
         def job(sublist):
             try:
@@ -314,9 +406,19 @@ class Video(Entry):
             Video.load_info(relatedvideos)
             self._related_videos.set(relatedvideos)
 
+    # single videos are queued so concurrent requests share API calls; this
+    # delays each of them by info_queue_delay (see queue_info)
+    @async_property
+    def title(self):
+        self.queue_info([self])
+
+    @async_property
+    def channel(self):
+        self.queue_info([self])
+
     @async_property
     def length(self):
-        self.load_info([self])
+        self.queue_info([self])
 
     @async_property
     def thumbnails(self):
@@ -394,6 +496,9 @@ class Video(Entry):
         # a download so audio can start playing quicker?
 
         def my_hook(d):
+            if d["status"] == "finished":
+                _cache_index.add(os.path.basename(d["filename"]))
+
             if d["status"] == "finished" and not self.total_bytes:
                 fileUri = (
                     # if it is finished, don't need to serve it up with tornado...
@@ -471,12 +576,11 @@ class Video(Entry):
                     info = {}
                     cached = [
                         cached_file
-                        for cached_file in os.listdir(cache_location)
-                        if cached_file
-                        in [
+                        for cached_file in [
                             f"{self.id}.{format}"
                             for format in ["webm", "m4a", "mp3", "ogg"]
                         ]
+                        if is_cached(cached_file)
                     ]
                     if cached:
                         fileUri = f"file://{(os.path.join(cache_location, cached[0]))}"
@@ -484,7 +588,7 @@ class Video(Entry):
                     else:
                         logger.debug(f"caching image {self.id}")
                         imageFile = f"{self.id}.webp"
-                        if imageFile not in os.listdir(cache_location):
+                        if not is_cached(imageFile):
                             imageUri = self.thumbnails.get()[0].uri
                             response = self.api.session.get(imageUri, stream=True)
                             if response.status_code == 200:
@@ -494,6 +598,7 @@ class Video(Entry):
                                     "wb",
                                 ) as out_file:
                                     shutil.copyfileobj(response.raw, out_file)
+                                _cache_index.add(imageFile)
                             del response
 
                         logger.debug(f"caching track {self.id}")
@@ -525,7 +630,7 @@ class Video(Entry):
 
                     # moved this here, because sometimes the metadata might go
                     # missing, even if the audio and the image do not
-                    if f"{self.id}.json" not in os.listdir(cache_location):
+                    if not is_cached(f"{self.id}.json"):
                         logger.debug(f"caching metadata {self.id}")
                         with open(
                             os.path.join(cache_location, f"{self.id}.json"), "w"
@@ -537,6 +642,7 @@ class Video(Entry):
                                 cls=ModelJSONEncoder,
                                 fp=outfile,
                             )
+                        _cache_index.add(f"{self.id}.json")
                 else:
                     with youtube_dl.YoutubeDL(ytdl_options) as ydl:
                         info = ydl.extract_info(
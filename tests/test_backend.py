@@ -213,3 +213,72 @@ def test_backend_playback_translate_uri(
         audio_url = backend_inst.playback.translate_uri(video_uri)
         # How to test this?
         assert audio_url
+
+
+def test_backend_get_playlist_images_batched(config, monkeypatch):
+    class StubAPI:
+        def __init__(self):
+            self.calls = []
+
+        def list_playlists(self, ids):
+            self.calls.append(ids)
+            return {
+                "items": [
+                    {
+                        "id": id,
+                        "snippet": {
+                            "title": f"title {id}",
+                            "channelTitle": "channel",
+                            "thumbnails": {
+                                "default": {
+                                    "url": f"https://example.com/{id}.jpg",
+                                    "width": 120,
+                                    "height": 90,
+                                }
+                            },
+                        },
+                        "contentDetails": {"itemCount": 3},
+                    }
+                    for id in ids
+                ]
+            }
+
+    backend_inst = get_backend(config=config, api_config={})
+    api = StubAPI()
+    monkeypatch.setattr(youtube.Entry, "api", api, raising=False)
+    youtube.Entry.cache.clear()
+
+    uris = [f"yt:playlist:PLbatched{i}" for i in range(3)]
+    images = backend_inst.library.get_images(uris)
+
+    assert api.calls == [[f"PLbatched{i}" for i in range(3)]]
+    for uri in uris:
+        assert isinstance(images[uri][0], Image)
+
+
+def test_backend_browse_caches_per_uri_kind(config, monkeypatch):
+    backend_inst = get_backend(config=config, api_config={})
+    library = backend_inst.library
+    for cache in (
+        library.browse_artists_cache,
+        library.browse_channel_cache,
+        library.browse_playlist_cache,
+    ):
+        cache.clear()
+
+    monkeypatch.setattr(
+        library,
+        "lookup",
+        lambda uri: [Track(uri="yt:video:nvlTJrNJ5lA", name="a track")],
+    )
+    monkeypatch.setattr(youtube.Channel, "playlists", lambda channel_id: [])
+
+    assert library.browse("youtube:browse")
+    assert library.browse("yt:playlist:PLo4c-riVwz2miWOT3Y2VWzg2bmV4FmC8J")
+    assert len(library.browse_playlist_cache) == 1
+    assert len(library.browse_channel_cache) == 0
+
+    assert library.browse("yt:channel:UCZtGOj7FTHPd2txgnbJS2kQ") == []
+    assert len(library.browse_playlist_cache) == 1
+    assert len(library.browse_channel_cache) == 1
+    assert len(library.browse_artists_cache) == 0
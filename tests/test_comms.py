@@ -0,0 +1,36 @@
+from unittest import mock
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from mopidy_youtube.comms import MyHTTPAdapter
+
+
+def get_session():
+    session = requests.Session()
+    session.mount("https://", MyHTTPAdapter())
+    return session
+
+
+def ok_response():
+    response = requests.Response()
+    response.status_code = 200
+    return response
+
+
+def test_adapter_applies_default_timeout():
+    with mock.patch.object(
+        HTTPAdapter, "send", return_value=ok_response()
+    ) as send_mock:
+        get_session().get("https://example.com/")
+
+    assert send_mock.call_args[1]["timeout"] == (6.05, 27)
+
+
+def test_adapter_keeps_explicit_timeout():
+    with mock.patch.object(
+        HTTPAdapter, "send", return_value=ok_response()
+    ) as send_mock:
+        get_session().get("https://example.com/", timeout=3)
+
+    assert send_mock.call_args[1]["timeout"] == 3
@@ -1,3 +1,5 @@
+import threading
+
 import pytest
 
 from mopidy_youtube import youtube
@@ -148,3 +150,79 @@ def test_youtube_channel_playlists(api, config, headers):
 
         assert isinstance(channel_playlists, list)
         assert len(channel_playlists) > 0
+
+
+def test_is_cached(tmp_path, monkeypatch, caplog):
+    monkeypatch.setattr(youtube, "cache_location", str(tmp_path))
+    monkeypatch.setattr(youtube, "_cache_index", set())
+    monkeypatch.setattr(youtube, "_cache_index_mtime", None)
+
+    (tmp_path / "cached.json").write_text("{}")
+    assert youtube.is_cached("cached.json")
+    assert not youtube.is_cached("missing.json")
+
+    # written straight after the scan, possibly within the same mtime tick
+    (tmp_path / "new.json").write_text("{}")
+    assert youtube.is_cached("new.json")
+
+    # a missing cache directory is only logged once
+    monkeypatch.setattr(youtube, "cache_location", str(tmp_path / "missing"))
+    monkeypatch.setattr(youtube, "_cache_index_error_logged", False)
+    assert not youtube.is_cached("cached.json")
+    assert not youtube.is_cached("cached.json")
+    assert caplog.text.count("cache index error") == 1
+
+
+class StubVideoAPI:
+    def __init__(self):
+        self.calls = []
+
+    def list_videos(self, ids):
+        self.calls.append(list(ids))
+        return {
+            "items": [
+                {
+                    "id": id,
+                    "snippet": {"title": f"title {id}", "channelTitle": "channel"},
+                    "contentDetails": {"duration": "PT1M"},
+                }
+                for id in ids
+            ]
+        }
+
+
+def test_queue_info_coalesces_concurrent_requests(monkeypatch):
+    api = StubVideoAPI()
+    monkeypatch.setattr(youtube.Entry, "api", api, raising=False)
+    monkeypatch.setattr(youtube.Video, "info_queue_delay", 0.2)
+    youtube.Entry.cache.clear()
+
+    videos = [youtube.Video.get(f"concurrent{i}") for i in range(5)]
+    lengths = []
+    threads = [
+        threading.Thread(target=lambda video=video: lengths.append(video.length.get()))
+        for video in videos
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert lengths == [60] * 5
+    assert len(api.calls) == 1
+    assert sorted(api.calls[0]) == sorted(video.id for video in videos)
+
+
+def test_queue_info_flushes_full_queue(monkeypatch):
+    api = StubVideoAPI()
+    monkeypatch.setattr(youtube.Entry, "api", api, raising=False)
+    # the timer must not be what sends the request
+    monkeypatch.setattr(youtube.Video, "info_queue_delay", 60)
+    youtube.Entry.cache.clear()
+
+    videos = [youtube.Video.get(f"full{i}") for i in range(50)]
+    youtube.Video.queue_info(videos)
+
+    assert api.calls == [[video.id for video in videos]]
+    assert youtube.Video.info_queue == []
+    assert videos[-1].title.get(timeout=1) == "title full49"